@@ -14,6 +14,8 @@ class PostAdmin(admin.ModelAdmin):
     prepopulated_fields = {'slug': ('title',)}
     # Use raw ID input for the author field to improve performance with large user sets
     raw_id_fields = ['author']
+    # Fetch the author with a JOIN so rendering the list view does not query per row
+    list_select_related = ['author']
     # Enables chronological navigation by publication date
     date_hierarchy = 'publication_date'
     # Default ordering of the list view
@@ -28,4 +30,6 @@ class CommentAdmin(admin.ModelAdmin):
     # Enable filters in the sidebar for quicker querying
     list_filter = ['is_visible', 'created_at', 'updated_at']
     # Add search capability on name, email and body fields
-    search_fields = ['name', 'email', 'body']
\ No newline at end of file
+    search_fields = ['name', 'email', 'body']
+    # Fetch the related post with a JOIN so rendering the list view does not query per row
+    list_select_related = ['post']
\ No newline at end of file
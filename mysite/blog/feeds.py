@@ -1,8 +1,7 @@
-import markdown
 from django.contrib.syndication.views import Feed
 from django.template.defaultfilters import truncatewords_html
 from django.urls import reverse_lazy
-from .models import Post
+from .services import get_latest_posts
 
 class LatestPostsFeed(Feed):
     """
@@ -15,12 +14,14 @@ class LatestPostsFeed(Feed):
 
     def items(self):
         """
-        Retrieve the latest five published posts.
+        Retrieve the latest five published posts from the shared cached helper, so the
+        feed and the sidebar widget reuse one query result. Only the columns the feed
+        renders are fetched, and the raw Markdown body is never pulled from the database.
 
         Returns:
-            QuerySet[Post]: Up to five most recent published Post instances.
+            list[Post]: Up to five most recent published Post instances.
         """
-        return Post.published.all()[:5]
+        return get_latest_posts(5)
 
     def item_title(self, item):
         """
@@ -36,7 +37,8 @@ class LatestPostsFeed(Feed):
 
     def item_description(self, item):
         """
-        Convert the post body from Markdown to HTML and truncate it to 30 words.
+        Truncate the post's stored HTML body to a 30-word preview.
+        The HTML is rendered from Markdown once at save time, so no parsing happens here.
 
         Args:
             item (Post): A blog post instance.
@@ -44,7 +46,7 @@ class LatestPostsFeed(Feed):
         Returns:
             str: An HTML string containing a truncated preview of the post's body.
         """
-        return truncatewords_html(markdown.markdown(item.body), 30)
+        return truncatewords_html(item.body_html, 30)
 
     def item_pubdate(self, item):
         """
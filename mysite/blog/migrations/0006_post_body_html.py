@@ -0,0 +1,34 @@
+# Generated by Django 5.2.17 on 2026-08-30 08:07
+
+import markdown
+from django.db import migrations, models
+
+
+def render_existing_bodies(apps, schema_editor):
+    # Backfill the stored HTML for posts created before the field existed
+    Post = apps.get_model('blog', 'Post')
+    posts = []
+    for post in Post.objects.all().iterator():
+        post.body_html = markdown.markdown(post.body)
+        posts.append(post)
+        if len(posts) >= 500:
+            Post.objects.bulk_update(posts, ['body_html'])
+            posts = []
+    if posts:
+        Post.objects.bulk_update(posts, ['body_html'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_trigram_ext'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='body_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(render_existing_bodies, migrations.RunPython.noop),
+    ]
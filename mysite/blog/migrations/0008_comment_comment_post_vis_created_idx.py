@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-30 08:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0007_post_post_status_pubdate_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'is_visible', 'created_at'], name='comment_post_vis_created_idx'),
+        ),
+    ]
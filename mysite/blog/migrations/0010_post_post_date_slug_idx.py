@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-30 08:11
+
+import django.db.models.functions.datetime
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_post_search_vector_post_post_search_vector_idx'),
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(django.db.models.functions.datetime.TruncDate('publication_date'), models.F('slug'), name='post_date_slug_idx'),
+        ),
+    ]
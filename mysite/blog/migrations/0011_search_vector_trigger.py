@@ -0,0 +1,38 @@
+from django.db import migrations
+
+# Maintain blog_post.search_vector inside the database, so every write path (ORM saves,
+# bulk updates, admin actions, raw SQL) keeps the vector current without an extra UPDATE
+# from the application. The trigger fires only when title or body actually change.
+CREATE_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION blog_post_search_vector_refresh() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := to_tsvector(
+        'english', coalesce(NEW.title, '') || ' ' || coalesce(NEW.body, '')
+    );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER blog_post_search_vector_update
+BEFORE INSERT OR UPDATE OF title, body ON blog_post
+FOR EACH ROW EXECUTE FUNCTION blog_post_search_vector_refresh();
+
+UPDATE blog_post
+SET search_vector = to_tsvector('english', coalesce(title, '') || ' ' || coalesce(body, ''));
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS blog_post_search_vector_update ON blog_post;
+DROP FUNCTION IF EXISTS blog_post_search_vector_refresh();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_post_post_date_slug_idx'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+    ]
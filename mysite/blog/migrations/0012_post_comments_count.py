@@ -0,0 +1,33 @@
+# Generated by Django 5.2.17 on 2026-08-30 08:16
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_comments_count(apps, schema_editor):
+    # Seed the denormalized counter from the existing visible comments
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+    counts = (
+        Comment.objects.filter(is_visible=True)
+        .values('post_id')
+        .annotate(total=Count('id'))
+    )
+    for row in counts:
+        Post.objects.filter(pk=row['post_id']).update(comments_count=row['total'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_search_vector_trigger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_comments_count, migrations.RunPython.noop),
+    ]
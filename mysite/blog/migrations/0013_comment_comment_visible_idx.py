@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-30 08:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0012_post_comments_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('is_visible', True)), fields=['post', 'created_at'], name='comment_visible_idx'),
+        ),
+    ]
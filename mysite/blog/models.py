@@ -1,10 +1,41 @@
+import threading
+
+import markdown
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import TruncDate
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils import timezone
 from taggit.managers import TaggableManager
 
+# Single reusable Markdown converter; constructing one per conversion would re-register
+# extensions and recompile the parser's regexes every time
+_markdown_converter = markdown.Markdown(output_format='html')
+# The converter mutates internal state while converting, so concurrent threads (e.g.
+# two Post saves under a threaded server) must not share it mid-conversion
+_markdown_lock = threading.Lock()
+
+def render_markdown(text):
+    """
+    Convert Markdown-formatted text to HTML using the shared precompiled converter.
+    Conversions are serialized with a lock because the converter is stateful while
+    it runs.
+
+    Args:
+        text (str): Markdown source text.
+
+    Returns:
+        str: The rendered HTML.
+    """
+    with _markdown_lock:
+        # Clear any state left over from the previous conversion before reusing the instance
+        _markdown_converter.reset()
+        return _markdown_converter.convert(text)
+
 # Define a custom manager to handle queries specific to published posts
 class PublishedManager(models.Manager):
     def get_queryset(self):
@@ -12,6 +43,8 @@ class PublishedManager(models.Manager):
         return super().get_queryset().filter(status=Post.Status.PUBLISHED)
 
     def get_by_id_or_404(self, post_id):
+        # The share and comment views, the only callers, render just the post itself,
+        # so no related rows are joined or prefetched here
         return get_object_or_404(self.get_queryset(), id=post_id)
 
 class Post(models.Model):
@@ -32,6 +65,9 @@ class Post(models.Model):
         related_name='blog_posts'
     )
     body = models.TextField()
+    # HTML rendering of the body, computed once at save time so read paths
+    # (feed, detail page) never have to run the Markdown parser
+    body_html = models.TextField(editable=False, blank=True)
     publication_date = models.DateTimeField(default=timezone.now)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -41,6 +77,14 @@ class Post(models.Model):
         choices=Status,
         default=Status.DRAFT
     )
+    # Denormalized number of visible comments, maintained by the Comment signal
+    # handlers; lets read paths (e.g. the detail page's ETag) skip a COUNT query
+    comments_count = models.PositiveIntegerField(default=0, editable=False)
+    # Precomputed tsvector over title and body, so full-text search matches against a
+    # stored, GIN-indexed column instead of computing to_tsvector per row per query
+    # Maintained by a database trigger (see migration 0011), which also covers writes
+    # that bypass save(), such as bulk updates and admin actions
+    search_vector = SearchVectorField(null=True, editable=False)
 
     #The default manager
     objects = models.Manager()
@@ -55,12 +99,29 @@ class Post(models.Model):
         # Database index on publication date for faster queries
         indexes = [
             models.Index(fields=['-publication_date']),
+            # Composite index matching the PublishedManager access pattern:
+            # filter on status and order by publication date in one index scan
+            models.Index(fields=['status', '-publication_date'], name='post_status_pubdate_idx'),
+            # GIN index over the stored search vector for full-text search lookups
+            GinIndex(fields=['search_vector'], name='post_search_vector_idx'),
+            # Functional index on (publication_date::date, slug) matching the detail-view
+            # lookup and the unique_for_date constraint on slug
+            models.Index(TruncDate('publication_date'), 'slug', name='post_date_slug_idx'),
+            # Trigram GIN index on the title, answering similarity lookups (typos,
+            # partial words) without scanning the table
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='post_title_trgm_idx'),
         ]
 
     # Human-readable representation of a post instance
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # Keep the stored HTML rendering in sync with the Markdown body
+        # The search vector is refreshed by a database trigger, not here
+        self.body_html = render_markdown(self.body)
+        super().save(*args, **kwargs)
+
     # Returns the absolute URL to access the detail view of this post instance
     def get_absolute_url(self):
         return reverse(
@@ -99,6 +160,16 @@ class Comment(models.Model):
         # Index on creation timestamp to optimize filtering and sorting by date
         indexes = [
             models.Index(fields=['created_at']),
+            # Composite index matching the per-post comment listing: filter on post
+            # and visibility, order by creation date, all from one index scan
+            models.Index(fields=['post', 'is_visible', 'created_at'], name='comment_post_vis_created_idx'),
+            # Partial variant covering only visible rows: smaller than the composite
+            # index and exactly matches the is_visible=True listing the detail page runs
+            models.Index(
+                fields=['post', 'created_at'],
+                condition=Q(is_visible=True),
+                name='comment_visible_idx'
+            ),
         ]
 
     def __str__(self):
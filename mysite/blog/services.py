@@ -1,7 +1,76 @@
-from django.core.mail import send_mail
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.core.cache import cache
+from django.core.mail import get_connection, send_mail
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from .models import Post
 
-def send_post_recommendation_email(post, cd, post_url):
+# Cache key holding the maintained count of published posts
+PUBLISHED_COUNT_CACHE_KEY = 'blog:published_count'
+# Cache key holding the version number that namespaces the latest-posts entries
+LATEST_POSTS_VERSION_KEY = 'blog:latest_posts:version'
+
+def _latest_posts_version():
+    # Current version of the latest-posts cache entries; initialized lazily
+    version = cache.get(LATEST_POSTS_VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.set(LATEST_POSTS_VERSION_KEY, version, None)
+    return version
+
+def invalidate_latest_posts_cache():
+    """
+    Invalidate every cached latest-posts list by bumping the version that namespaces
+    their cache keys. Bumping one counter sidesteps having to know which counts were
+    cached, which plain key deletion cannot do portably.
+    """
+    try:
+        cache.incr(LATEST_POSTS_VERSION_KEY)
+    except ValueError:
+        cache.set(LATEST_POSTS_VERSION_KEY, 1, None)
+
+def get_latest_posts(count=5):
+    """
+    Return the latest published posts, cached so that the sidebar widget and the RSS feed
+    share one query result instead of each running the same SELECT.
+    Only the columns those consumers render are fetched. Entries are invalidated by the
+    Post signal handlers and additionally expire after two minutes as a safety net.
+
+    Args:
+        count (int, optional): Number of posts to return.
+
+    Returns:
+        list[Post]: The most recent published posts, newest first.
+    """
+    return cache.get_or_set(
+        f'blog:latest_posts:{_latest_posts_version()}:{count}',
+        lambda: list(
+            Post.published.only('id', 'title', 'slug', 'body_html', 'publication_date')[:count]
+        ),
+        120
+    )
+
+def get_published_post_count():
+    """
+    Return the number of published posts without querying the database on every call.
+    The value is kept current by the signal handlers in signals.py, which adjust it
+    whenever a post is published, unpublished or deleted, and expires after two minutes
+    as a safety net: with a per-process cache backend the handlers only run in the
+    worker that performed the write, so other workers' counters drift and would
+    otherwise never reconcile. A missing or expired entry is lazily backfilled with a
+    single exact COUNT.
+
+    Returns:
+        int: The number of published posts.
+    """
+    count = cache.get(PUBLISHED_COUNT_CACHE_KEY)
+    if count is None:
+        count = Post.published.count()
+        cache.set(PUBLISHED_COUNT_CACHE_KEY, count, 120)
+    return count
+
+def send_post_recommendation_email(post, cd, post_url, connection=None):
     """
     Sends a recommendation email for a given blog post, including the post title, a link to the post, and any additional comments.
 
@@ -9,6 +78,8 @@ def send_post_recommendation_email(post, cd, post_url):
          post (Post): The blog post object being recommended.
          cd (dict): Cleaned form data containing the recommender's name, email, recipient's email, and optional comments.
          post_url (str): Absolute URL to the blog post.
+         connection: Optional email backend connection to send through; lets batched callers
+            reuse one SMTP connection instead of paying the TLS handshake per message.
 
     Returns:
         None
@@ -24,36 +95,184 @@ def send_post_recommendation_email(post, cd, post_url):
         subject=subject,
         message=message,
         from_email=None,    # Uses DEFAULT_FROM_EMAIL from settings.py
-        recipient_list=[cd['to']]
+        recipient_list=[cd['to']],
+        connection=connection
     )
 
-def paginate_queryset(request, queryset, per_page=5):
+def send_post_recommendation_emails(recommendations):
+    """
+    Send a batch of recommendation emails over a single SMTP connection.
+    Opening the connection once amortizes the TLS/EHLO handshake over the whole batch,
+    which is the dominant cost of sending transactional mail.
+
+    Args:
+        recommendations (iterable): An iterable of (post, cd, post_url) tuples, each with the
+            same meaning as the arguments of send_post_recommendation_email.
+
+    Returns:
+        None
+    """
+    with get_connection() as connection:
+        for post, cd, post_url in recommendations:
+            send_post_recommendation_email(post, cd, post_url, connection=connection)
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that can be seeded with an already-known result count.
+    Django's Paginator issues a SELECT COUNT(*) the first time count is accessed; when the
+    caller already has the total (e.g. the maintained published-post counter), seeding it
+    here removes that query from every paginated request.
+    """
+
+    # Above this many rows the exact total is cosmetic and the planner's estimate is
+    # close enough for computing num_pages
+    ESTIMATE_THRESHOLD = 10000
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            # Pre-populate the cached property backing Paginator.count
+            self.__dict__['count'] = count
+
+    @cached_property
+    def count(self):
+        # For large unfiltered tables, read the planner's row estimate from pg_class
+        # (an O(1) catalog lookup) instead of scanning an index to count exactly
+        estimate = self._estimated_count()
+        if estimate is not None and estimate > self.ESTIMATE_THRESHOLD:
+            return estimate
+        return super().count
+
+    def _estimated_count(self):
+        # Only an unfiltered queryset maps one-to-one onto its table, so only then does
+        # the table-level estimate describe the result set
+        object_list = self.object_list
+        if getattr(object_list, 'query', None) is None or object_list.query.where:
+            return None
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [object_list.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+        except Exception:
+            return None
+        return row[0] if row else None
+
+class PKPaginator(CachedCountPaginator):
+    """
+    Paginator that slices each page by primary key first.
+    A plain OFFSET slice drags every selected column through the rows the database scans
+    and discards, so deep pages pay for columns they never return. Slicing a pk-only
+    projection lets the skip run off the covering primary-key index; the page's full rows
+    are then fetched with a pk IN (...) query bounded by per_page, which preserves the
+    queryset's ordering, annotations and prefetches.
+    """
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not hasattr(self.object_list, 'values_list'):
+            # Plain sequences cannot be re-filtered; fall back to normal slicing
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        pks = list(self.object_list.values_list('pk', flat=True)[bottom:top])
+        return self._get_page(self.object_list.filter(pk__in=pks), number, self)
+
+def _cached_count(queryset, cache_key, ttl=60):
+    """
+    Return the queryset's total count, cached under the given key, so repeated paginated
+    requests for the same listing share one COUNT query per TTL window.
+
+    Args:
+        queryset (QuerySet): The queryset to count.
+        cache_key (str): Cache key identifying the listing (e.g. per tag).
+        ttl (int, optional): Seconds to keep the cached count.
+
+    Returns:
+        int: The number of objects in the queryset.
+    """
+    count = cache.get(cache_key)
+    if count is None:
+        count = queryset.count()
+        cache.set(cache_key, count, ttl)
+    return count
+
+def paginate_queryset(request, queryset, per_page=5, count=None, cache_key=None):
     """
     Paginate a given queryset based on the GET request's page parameter.
-    Handles edge cases such as non-integer page numbers and out-of-range pages.
+    Handles edge cases such as non-integer page numbers and out-of-range pages by clamping
+    the requested page into the valid range before fetching, so no fallback query is ever
+    needed.
 
     Args:
         request (HttpRequest): The HTTP request object.
         queryset (QuerySet): The queryset of objects to paginate.
         per_page (int, optional): Number of items per page.
+        count (int, optional): Known total number of objects; when given, the paginator
+            skips its own COUNT query.
+        cache_key (str, optional): When given (and count is not), the total is looked up
+            via _cached_count under this key instead of recounting on every request.
 
     Returns:
         Page: A Django Page object containing the objects for the current page.
     """
 
-    # Create a Paginator instance with the specified number of items per page
-    paginator = Paginator(queryset, per_page)
-    # Get the current page number from the request query parameters, defaulting to 1 if absent
-    page_number = request.GET.get('page', 1)
+    if count is None and cache_key is not None:
+        count = _cached_count(queryset, cache_key)
+
+    # Create a paginator with the specified number of items per page, reusing a known
+    # result count when available and slicing pages by primary key
+    paginator = PKPaginator(queryset, per_page, count=count)
 
+    # Get the current page number from the request query parameters, defaulting to 1
+    # if absent or not an integer
     try:
-        # Fetch posts for the requested page
-        posts = paginator.page(page_number)
-    except PageNotAnInteger:
-        # If page_number is not an integer, return the first page
-        posts = paginator.page(1)
-    except EmptyPage:
-        # If page number is out of range, deliver the last valid page
-        posts = paginator.page(paginator.num_pages)
-
-    return posts
\ No newline at end of file
+        page_number = int(request.GET.get('page', 1))
+    except (TypeError, ValueError):
+        page_number = 1
+    # Clamp into the valid range: out-of-range pages deliver the first or last page
+    # without going through an EmptyPage round-trip
+    page_number = min(max(page_number, 1), paginator.num_pages)
+
+    return paginator.page(page_number)
+
+def paginate_by_cursor(request, queryset, per_page=5, cursor_field='publication_date'):
+    """
+    Paginate a queryset with keyset (seek) pagination based on the GET request's cursor parameter.
+    Unlike OFFSET-based pagination, where the database scans and discards all rows before the
+    requested page, seeking to rows older than the cursor is an index range scan whose cost does
+    not grow with page depth.
+
+    Args:
+        request (HttpRequest): The HTTP request object; the cursor is read from ?cursor=<iso datetime>.
+        queryset (QuerySet): The queryset of objects to paginate.
+        per_page (int, optional): Number of items per page.
+        cursor_field (str, optional): Datetime field the queryset is ordered and seeked by.
+
+    Returns:
+        tuple: A (results, next_cursor) pair, where results is the list of objects for the page and
+        next_cursor is the ISO-formatted cursor for the following page, or None on the last page.
+    """
+
+    ordered = queryset.order_by(f'-{cursor_field}')
+
+    cursor = request.GET.get('cursor')
+    if cursor:
+        cursor_value = parse_datetime(cursor)
+        if cursor_value is not None:
+            # Seek directly to the rows older than the cursor
+            ordered = ordered.filter(**{f'{cursor_field}__lt': cursor_value})
+
+    # Fetch one extra row to find out whether a next page exists
+    results = list(ordered[:per_page + 1])
+
+    next_cursor = None
+    if len(results) > per_page:
+        results = results[:per_page]
+        next_cursor = getattr(results[-1], cursor_field).isoformat()
+
+    return results, next_cursor
\ No newline at end of file
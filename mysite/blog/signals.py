@@ -0,0 +1,70 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from .models import Comment, Post
+from .services import PUBLISHED_COUNT_CACHE_KEY, invalidate_latest_posts_cache
+
+
+def _adjust_published_count(delta):
+    # Adjust the maintained counter in place
+    # If it is not cached yet, leave it to be lazily backfilled by get_published_post_count()
+    try:
+        cache.incr(PUBLISHED_COUNT_CACHE_KEY, delta)
+    except ValueError:
+        pass
+
+@receiver(pre_save, sender=Post)
+def stash_previous_status(sender, instance, **kwargs):
+    """
+    Remember the status currently stored in the database so update_published_count_on_save
+    can detect publish/unpublish transitions.
+    """
+    if instance.pk:
+        instance._previous_status = (
+            Post.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+        )
+    else:
+        instance._previous_status = None
+
+@receiver(post_save, sender=Post)
+def update_published_count_on_save(sender, instance, **kwargs):
+    """
+    Keep the cached published-post count in sync when a post transitions to or from
+    the PUBLISHED status.
+    """
+    was_published = getattr(instance, '_previous_status', None) == Post.Status.PUBLISHED
+    is_published = instance.status == Post.Status.PUBLISHED
+    if is_published != was_published:
+        _adjust_published_count(1 if is_published else -1)
+
+@receiver(post_delete, sender=Post)
+def update_published_count_on_delete(sender, instance, **kwargs):
+    """
+    Decrement the cached published-post count when a published post is deleted.
+    """
+    if instance.status == Post.Status.PUBLISHED:
+        _adjust_published_count(-1)
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def refresh_comments_count(sender, instance, **kwargs):
+    """
+    Keep Post.comments_count in sync with the visible comments whenever a comment is
+    created, edited (e.g. moderated) or deleted. The recount is a single indexed query
+    over one post's comments, and update() writes it without touching updated_at or
+    firing the Post signal handlers.
+    """
+    Post.objects.filter(pk=instance.post_id).update(
+        comments_count=Comment.objects.filter(
+            post_id=instance.post_id, is_visible=True
+        ).count()
+    )
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_latest_posts(sender, instance, **kwargs):
+    """
+    Drop the cached latest-posts lists whenever a post changes, so the sidebar widget
+    and the feed pick up the new content on their next render.
+    """
+    invalidate_latest_posts_cache()
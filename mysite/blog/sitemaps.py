@@ -1,4 +1,5 @@
 from django.contrib.sitemaps import Sitemap
+from django.urls import reverse
 from .models import Post
 
 class PostSitemap(Sitemap):
@@ -6,12 +7,35 @@ class PostSitemap(Sitemap):
     changefreq = 'weekly'
     # Their relevance in our website (the maximum value is 1)
     priority = 0.9
+    # Cap the URLs per sitemap page (default is 50000) to keep each response predictable
+    limit = 5000
 
-    # The QuerySet of objects to include in this sitemap
+    # The objects to include in this sitemap
+    # Fetch only the columns the sitemap renders, as plain dicts, skipping both the wide
+    # body columns and the cost of instantiating a Post object per URL
+    # Stream the rows through a server-side cursor so the database adapter never buffers
+    # the whole result set; the sitemap framework needs a sequence for pagination, so the
+    # narrow dicts are collected into a list
     def items(self):
-        return Post.published.all()
+        return list(
+            Post.published.values('slug', 'publication_date', 'updated_at')
+            .iterator(chunk_size=500)
+        )
+
+    # Build each post's URL from the fetched columns, mirroring Post.get_absolute_url
+    def location(self, obj):
+        publication_date = obj['publication_date']
+        return reverse(
+            'blog:post_detail',
+            args=[
+                publication_date.year,
+                publication_date.month,
+                publication_date.day,
+                obj['slug']
+            ]
+        )
 
     # For each post, return the date it was last updated
     # This helps search engines know when the content has changed
     def lastmod(self, obj):
-        return obj.updated_at
\ No newline at end of file
+        return obj['updated_at']
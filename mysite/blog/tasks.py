@@ -0,0 +1,24 @@
+from celery import shared_task
+from .models import Post
+from .services import send_post_recommendation_email
+
+@shared_task(autoretry_for=(OSError,), retry_backoff=True, retry_kwargs={'max_retries': 3})
+def send_post_recommendation_email_task(post_id, cd, post_url):
+    """
+    Send a post recommendation email from a celery worker instead of the request path.
+    The task receives the post id rather than the model instance to keep the message
+    payload small and serializable; only the title is fetched, as the email needs
+    nothing else from the post.
+    Transient SMTP/network failures (OSError covers smtplib's exceptions) are retried
+    up to three times with exponential backoff.
+
+    Args:
+        post_id (int): The ID of the blog post being recommended.
+        cd (dict): Cleaned form data containing the recommender's name, email, recipient's email, and optional comments.
+        post_url (str): Absolute URL to the blog post.
+
+    Returns:
+        None
+    """
+    post = Post.objects.only('title').get(pk=post_id)
+    send_post_recommendation_email(post, cd, post_url)
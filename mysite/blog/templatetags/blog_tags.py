@@ -1,32 +1,38 @@
 from django import template
-from django.db.models import Count
+from django.db.models import Count, Q
 from django.utils.safestring import mark_safe
-import markdown
-from ..models import Post
+from ..models import Post, render_markdown
+from ..services import get_latest_posts, get_published_post_count
 
 # Create a template library instance to register custom tags
 register = template.Library()
 
 @register.simple_tag
 def total_posts():
-    # Return the count of all posts using the custom published manager
-    return Post.published.count()
+    # Return the maintained count of published posts; a cache read instead of a COUNT query
+    return get_published_post_count()
 
 @register.inclusion_tag('blog/post/latest_posts.html')
 def show_latest_posts(count=5):
-    # Get the latest 'count' published posts, ordered by descending publication_date
-    latest_posts = Post.published.order_by('-publication_date')[:count]
+    # Get the latest 'count' published posts from the shared cached helper, which the
+    # RSS feed also uses, so both render from one query result
     # Return the posts in a dictionary to render them in the latest_posts.html template
-    return {'latest_posts': latest_posts}
+    return {'latest_posts': get_latest_posts(count)}
 
 @register.simple_tag
 def get_most_commented_posts(count=5):
-    # Returns the top 'count' most commented published posts, ordered first by number of comments,
+    # Returns the top 'count' most commented published posts, ordered first by number of visible comments,
     # then by publication date (both descending)
-    return Post.published.annotate(total_comments=Count('comments')).order_by('-total_comments', '-publication_date')[:count]
+    # The sidebar renders only each post's title and URL, so no comment rows are fetched
+    return (
+        Post.published.annotate(
+            total_comments=Count('comments', filter=Q(comments__is_visible=True))
+        )
+        .order_by('-total_comments', '-publication_date')[:count]
+    )
 
 # Custom Django template filter that converts markdown-formatted text to HTML
-# Uses the markdown library for conversion and marks the result as safe to prevent auto-escaping in templates
+# Uses the shared precompiled converter and marks the result as safe to prevent auto-escaping in templates
 @register.filter(name='markdown')
 def markdown_format(text):
-    return mark_safe(markdown.markdown(text))
\ No newline at end of file
+    return mark_safe(render_markdown(text))
\ No newline at end of file
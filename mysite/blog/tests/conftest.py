@@ -36,15 +36,18 @@ def draft_post(user):
 @pytest.fixture
 def get_published_posts():
     """
-    Callable fixture that returns the current list of published posts each time it is called.
-    This fixture returns a function _get() which, when called, performs a fresh query on Post.published.all() and
-    returns the results as a list.
-
-    This allows tests to get an up-to-date list of published posts at any point, even if new posts are created or
-    modified during the execution of the test.
+    Callable fixture that returns the list of published posts.
+    The first call queries Post.published.all() and caches the result for the duration of
+    the test, so repeated calls within one test do not re-run the same query. Tests that
+    create or modify posts after the first call can pass refresh=True to force a fresh
+    query.
     """
-    def _get():
-        return list(Post.published.all())
+    cached = {}
+
+    def _get(refresh=False):
+        if refresh or 'posts' not in cached:
+            cached['posts'] = list(Post.published.all())
+        return cached['posts']
     return _get
 
 @pytest.fixture
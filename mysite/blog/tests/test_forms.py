@@ -0,0 +1,39 @@
+from blog.forms import CommentForm, FastEmailField
+
+def make_comment_form(email):
+    return CommentForm(data={'name': 'Reader', 'email': email, 'body': 'Nice post!'})
+
+def test_comment_form_email_uses_fast_field_with_model_max_length():
+    """
+    The email field must be swapped in via Meta.field_classes so the model-derived
+    kwargs survive: a declared field override would silently drop max_length=254 and
+    let over-long addresses through to the varchar(254) column.
+    """
+    field = CommentForm().fields['email']
+    assert isinstance(field, FastEmailField)
+    assert field.max_length == 254
+
+def test_valid_email_passes():
+    """A well-formed address passes the shape check and the full validator."""
+    form = make_comment_form('reader@example.com')
+    assert form.is_valid(), form.errors
+
+def test_malformed_email_fails_with_standard_invalid_error():
+    """
+    An address failing the shape check must surface the standard 'invalid' validation
+    error. EmailField carries no 'invalid' entry in error_messages, so reading it there
+    used to raise KeyError on exactly the garbage input the fast path exists to reject.
+    """
+    form = make_comment_form('not-an-email')
+    assert not form.is_valid()
+    assert form.errors['email'] == ['Enter a valid email address.']
+    assert form.errors.as_data()['email'][0].code == 'invalid'
+
+def test_overlong_email_fails_on_max_length():
+    """
+    An address that satisfies the validator but exceeds the column's 254 characters must
+    fail form validation instead of blowing up on the database insert.
+    """
+    form = make_comment_form('a' * 250 + '@example.com')
+    assert not form.is_valid()
+    assert form.errors.as_data()['email'][0].code == 'max_length'
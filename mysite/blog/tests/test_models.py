@@ -49,6 +49,24 @@ def test_published_manager_returns_multiple_posts(get_published_posts, multiple_
     assert len(posts) == 3, "There should be exactly 3 published posts"
     assert_all_posts_published(posts)
 
+@pytest.mark.django_db
+def test_get_published_posts_refresh_picks_up_new_posts(get_published_posts, user, published_post):
+    """
+    The memoized fixture should return its cached result on repeated calls and only
+    re-query the database when refresh=True is passed.
+    """
+    assert len(get_published_posts()) == 1
+    Post.objects.create(
+        title="Another Published Post",
+        slug="another-published-post",
+        author=user,
+        body="More published content",
+        status=Post.Status.PUBLISHED,
+    )
+    # The cached result is returned until a refresh is requested
+    assert len(get_published_posts()) == 1
+    assert len(get_published_posts(refresh=True)) == 2
+
 @pytest.mark.django_db
 def test_get_absolute_url_matches_reverse_pattern(published_post):
     """
@@ -1,4 +1,5 @@
 from django.urls import path
+from django.views.decorators.cache import cache_page
 from . import views
 from .feeds import LatestPostsFeed
 
@@ -7,10 +8,12 @@ app_name = 'blog'
 
 # URL patterns for the blog app
 urlpatterns = [
-    path('', views.post_list, name='post_list'),
-    # path('', views.PostListView.as_view(), name='post_list'),
+    # Cache each list page for a minute, keyed on the full URL so every page number and
+    # tag gets its own entry; a cache hit skips the queries and the template render
+    path('', cache_page(60)(views.post_list), name='post_list'),
+    # path('', cache_page(60)(views.PostListView.as_view()), name='post_list'),
 
-    path('tag/<slug:tag_slug>/', views.post_list, name='post_list_by_tag'),
+    path('tag/<slug:tag_slug>/', cache_page(60)(views.post_list), name='post_list_by_tag'),
 
     path('<int:year>/<int:month>/<int:day>/<slug:post>/', views.post_detail, name='post_detail'),
 
@@ -18,7 +21,9 @@ urlpatterns = [
 
     path('<int:post_id>/comment/', views.post_comment, name='post_comment'),
 
-    path('feed/', LatestPostsFeed(), name='post_feed'),
+    # Cache the rendered feed XML for 15 minutes so repeated fetches by feed readers
+    # skip the post query and the Markdown rendering entirely
+    path('feed/', cache_page(60 * 15)(LatestPostsFeed()), name='post_feed'),
 
     path('search/', views.post_search, name='post_search'),
 ]
\ No newline at end of file
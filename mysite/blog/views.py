@@ -1,18 +1,61 @@
+from datetime import date
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank, TrigramSimilarity
-from django.db.models import Count, Q
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, render
-from django.views.decorators.http import require_POST
+from django.template.loader import render_to_string
+from django.views.decorators.http import condition, require_POST
 from django.views.generic import ListView
-from taggit.models import Tag
+from taggit.models import Tag, TaggedItem
 from .forms import CommentForm, EmailPostForm, SearchForm
-from .models import Post
-from .services import paginate_queryset, send_post_recommendation_email
+from .models import Comment, Post
+from .services import _cached_count, get_published_post_count, paginate_queryset
+from .tasks import send_post_recommendation_email_task
+
+# Unbound forms carry no per-request state, so a single instance can be shared across
+# requests instead of re-running field copying and widget setup on every render
+# Bound forms (POST data, search queries) are still constructed per request
+_EMPTY_COMMENT_FORM = CommentForm()
+_EMPTY_SEARCH_FORM = SearchForm()
+
+# Tag listings with more posts than this are streamed rather than rendered in one pass
+STREAMING_THRESHOLD = 50
+# Marker in list_stream.html at which the streamed post summaries are spliced in
+_STREAM_POSTS_MARKER = '<!-- posts -->'
+
+def _stream_post_list(request, post_list, tag):
+    """
+    Generate a tag page incrementally. The page shell is rendered once and split at the
+    marker where the posts belong; the head goes out immediately, then the summaries are
+    rendered and sent a batch at a time while the queryset is consumed through a
+    server-side cursor. Time to first byte no longer grows with the tag's size, and
+    memory peaks at the iterator's chunk rather than the full post list.
+    """
+    head, tail = render_to_string(
+        'blog/post/list_stream.html', {'tag': tag}, request
+    ).split(_STREAM_POSTS_MARKER)
+    yield head
+    batch = []
+    # iterator() with an explicit chunk_size keeps the tags prefetch, executed per chunk
+    for post in post_list.iterator(chunk_size=200):
+        batch.append(
+            render_to_string('blog/post/includes/post_summary.html', {'post': post})
+        )
+        if len(batch) >= 20:
+            yield ''.join(batch)
+            batch = []
+    if batch:
+        yield ''.join(batch)
+    yield tail
 
 def post_list(request, tag_slug=None):
     """
     Display a list of published blog posts, optionally filtered by tag.
     If a tag_slug is provided, the view filters posts to only include those tagged accordingly.
-    The result is paginated.
+    The result is paginated; tag listings holding more than STREAMING_THRESHOLD posts
+    are streamed in full instead (unless a specific page was requested), so the first
+    byte is sent before the whole list has been rendered.
 
     Args:
         request (HttpRequest): The HTTP request object.
@@ -21,16 +64,49 @@ def post_list(request, tag_slug=None):
     Returns:
         HttpResponse: Rendered HTML page displaying the list of posts.
     """
-    post_list = Post.published.all()
+    # Join the author and prefetch the tags up-front: the list template renders both,
+    # and taggit otherwise issues one query per post for its generic relation
+    # Restrict the row to the columns the template shows — in particular the raw
+    # Markdown body stays in the database, only the stored HTML comes over the wire
+    post_list = (
+        Post.published.select_related('author')
+        .prefetch_related(
+            Prefetch('tags', queryset=Tag.objects.only('id', 'name', 'slug'))
+        )
+        .only(
+            'id', 'title', 'slug', 'body_html', 'publication_date', 'author__username'
+        )
+    )
     tag = None
+    # The unfiltered list can reuse the maintained published-post count, sparing the
+    # paginator its COUNT query; tag-filtered lists resolve their cached count below
+    count = get_published_post_count()
 
     if tag_slug:
         # Retrieve the tag object by its slug or return 404 if not found
         tag = get_object_or_404(Tag, slug=tag_slug)
-        # Filter posts by the specified tag
-        post_list = post_list.filter(tags__in=[tag])
-
-    paginated_posts = paginate_queryset(request, post_list, per_page=5)
+        # Filter posts with an EXISTS semi-join against the tag assignment table
+        # Unlike joining through tags__in, a semi-join cannot duplicate post rows, so
+        # neither the page query nor the paginator's COUNT needs deduplication
+        post_list = post_list.filter(
+            Exists(
+                TaggedItem.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Post),
+                    object_id=OuterRef('pk'),
+                    tag=tag
+                )
+            )
+        )
+        # The cached per-tag count feeds the paginator and doubles as the streaming
+        # gate: listings too large to materialize up-front are streamed in full, but an
+        # explicit ?page=N request keeps the paginated rendering it is asking for
+        count = _cached_count(post_list, f'blog:post_count:tag:{tag_slug}')
+        if count > STREAMING_THRESHOLD and 'page' not in request.GET:
+            return StreamingHttpResponse(_stream_post_list(request, post_list, tag))
+
+    paginated_posts = paginate_queryset(
+        request, post_list, per_page=5, count=count
+    )
 
     return render(
         request,
@@ -41,9 +117,46 @@ def post_list(request, tag_slug=None):
         }
     )
 
+def _publication_date_or_404(year, month, day):
+    """
+    Build the calendar date from the URL components, raising Http404 for out-of-range
+    values. The URLconf only checks that year, month and day are integers, so month 13
+    or February 30 must fall through to a 404 like any other missing post rather than
+    crash the date constructor.
+    """
+    try:
+        return date(year, month, day)
+    except ValueError:
+        raise Http404('Invalid publication date.')
+
+def _post_detail_etag(request, year, month, day, post):
+    """
+    Build the detail page's ETag from the post's last update and its visible-comment
+    count, both read in one narrow indexed query. Clients holding a current copy get a
+    304 without the page being rebuilt; editing the post or adding a comment changes
+    the tag.
+    """
+    values = (
+        Post.published
+        .filter(slug=post, publication_date__date=_publication_date_or_404(year, month, day))
+        .values_list('updated_at', 'comments_count')
+        .first()
+    )
+    if values is None:
+        return None
+    updated_at, comments_count = values
+    return f'"{updated_at.timestamp()}-{comments_count}"'
+
+# No cache_page here: the page embeds the comment form's csrf_token, and a view-level
+# cache stores the response before CsrfViewMiddleware sets the cookie and Vary header,
+# so cache-hit visitors would get a token with no matching cookie and their comment
+# POSTs would 403. The ETag alone still spares repeat visitors the full rebuild.
+@condition(etag_func=_post_detail_etag)
 def post_detail(request, year, month, day, post):
     """
     Display the details of a single published post, retrieved based on its slug and publication date.
+    Responses are served conditionally via an ETag, so repeat visits with a current
+    copy skip the similar-posts aggregation and the full render.
 
     Args:
         request (HttpRequest): The HTTP request object.
@@ -57,36 +170,58 @@ def post_detail(request, year, month, day, post):
         to four similar posts based on shared tags.
 
     Raises:
-        Http404: If no matching published post is found for the given slug and date.
+        Http404: If the URL components do not form a valid date, or no matching
+        published post is found for the given slug and date.
     """
+    # Filter on the calendar date directly so the lookup maps onto the functional
+    # (publication_date::date, slug) index instead of separate year/month/day extractions
+    # The author comes with the post row via a JOIN, and the visible comments and the
+    # tags are batched into one prefetch query each instead of separate lazy lookups
     post = get_object_or_404(
-        Post,
-        status=Post.Status.PUBLISHED,
+        Post.published.select_related('author').prefetch_related(
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.filter(is_visible=True),
+                to_attr='visible_comments'
+            ),
+            'tags'
+        ),
         slug=post,
-        publication_date__year=year,
-        publication_date__month=month,
-        publication_date__day=day
+        publication_date__date=_publication_date_or_404(year, month, day)
     )
 
-    # Retrieve visible comments related to the post
-    comments = post.comments.filter(is_visible=True)
-    # Initialize an empty form for user submissions
-    form = CommentForm()
-
-    # Retrieve the IDs of tags associated with the current post
-    post_tags_ids = post.tags.values_list('id', flat=True)
-    # Find up to 4 published posts that share the most tags with the current post
-    # Use a Q object to filter only tags that match those of the current post, and ensure the count
-    # is distinct to avoid duplicates
-    # Order the results by the number of shared tags (descending), then by publication date (most recent first)
-    similar_posts = (
-        Post.published
-        .filter(tags__in=post_tags_ids)
-        .exclude(id=post.id)
-        .annotate(
-            same_tags=Count('tags', filter=Q(tags__in=post_tags_ids), distinct=True)
-        ).order_by('-same_tags', '-publication_date')[:4]
+    # Visible comments were prefetched alongside the post
+    comments = post.visible_comments
+    # Shared empty form for user submissions
+    form = _EMPTY_COMMENT_FORM
+
+    # Read the tag IDs from the prefetched tags rather than querying for them
+    post_tags_ids = [post_tag.id for post_tag in post.tags.all()]
+    # Count shared tags directly on the narrow tag assignment table, restricted to the
+    # current post's tags, instead of joining it into a Post-wide aggregate that needs
+    # a DISTINCT count over the expanded join
+    # Take a few more candidates than needed so unpublished ones can drop out below
+    top_shared = (
+        TaggedItem.objects
+        .filter(
+            content_type=ContentType.objects.get_for_model(Post),
+            tag_id__in=post_tags_ids
+        )
+        .exclude(object_id=post.id)
+        .values('object_id')
+        .annotate(same_tags=Count('tag_id'))
+        .order_by('-same_tags')[:16]
     )
+    shared_counts = {row['object_id']: row['same_tags'] for row in top_shared}
+    # Fetch the candidate posts in a single query; only published ones come back
+    posts_by_id = Post.published.in_bulk(shared_counts)
+    # Order by number of shared tags, then by publication date (most recent first),
+    # and keep the top 4
+    similar_posts = sorted(
+        posts_by_id.values(),
+        key=lambda candidate: (shared_counts[candidate.pk], candidate.publication_date),
+        reverse=True
+    )[:4]
 
     return render(
         request,
@@ -124,8 +259,8 @@ def post_share(request, post_id):
             cd = form.cleaned_data
             # Build the full absolute URL to the post for inclusion in the email
             post_url = request.build_absolute_uri(post.get_absolute_url())
-            # Delegate email sending to the service layer
-            send_post_recommendation_email(post, cd, post_url)
+            # Queue the email for a background worker so the response does not wait on SMTP
+            send_post_recommendation_email_task.delay(post.id, cd, post_url)
             sent = True
     else:
         form = EmailPostForm()
@@ -189,12 +324,12 @@ def basic_search(query):
     Returns:
         QuerySet: Posts matching the search query.
     """
-    # Perform a full-text search on published posts by creating a search vector from the title and body fields, # then filter posts that match the user's query
-    return (
-        Post.published.annotate(
-            search=SearchVector('title', 'body')
-        )
-        .filter(search=query)
+    # Match the user's query against the stored, GIN-indexed search vector instead of
+    # computing a search vector per row at query time
+    # The query config must match the stored vector's ('english') for the planner to use
+    # the GIN index; websearch parsing also tolerates arbitrary user input
+    return Post.published.filter(
+        search_vector=SearchQuery(query, config='english', search_type='websearch')
     )
 
 def ranked_search(query):
@@ -207,20 +342,19 @@ def ranked_search(query):
     Returns:
         QuerySet: Posts matching the search query, ordered by rank.
     """
-    # Combine title and body fields into a single search vector
-    search_vector = SearchVector('title', 'body', config='english')
     # Convert the user's query into a format suitable for PostgreSQL full-text search
-    search_query = SearchQuery(query, config='english')
+    # The config matches the stored vector's so the GIN index stays usable, and websearch
+    # parsing never raises on unbalanced quotes or stray operators in user input
+    search_query = SearchQuery(query, config='english', search_type='websearch')
 
-    # Annotate the posts queryset with (search) the combined search vector used for full-text search and
-    # (rank) a relevance score calculated by comparing the search vector to the search query
-    # Then filter posts matching the query and order by descending relevance (highest rank first)
+    # Filter against the stored search vector, which the GIN index answers directly,
+    # and rank the matches with the same stored column
+    # Order by descending relevance (highest rank first)
     return (
         Post.published.annotate(
-            search=search_vector,
-            rank=SearchRank(search_vector, search_query)
+            rank=SearchRank('search_vector', search_query)
         )
-        .filter(search=search_query)
+        .filter(search_vector=search_query)
         .order_by('-rank')
     )
 
@@ -241,15 +375,17 @@ def weighted_search(query):
             SearchVector('title', weight='A', config='english') +
             SearchVector('body', weight='B', config='english')
     )
-    # Convert the user’s query into a format suitable for PostgreSQL full-text search
-    search_query = SearchQuery(query, config='english')
-
-    # Annotate the posts queryset with (search) the combined search vector used for full-text search and
-    # (rank) a relevance score calculated by comparing the search vector to the search query
+    # Convert the user’s query into a format suitable for PostgreSQL full-text search,
+    # using websearch parsing so arbitrary user input never raises
+    search_query = SearchQuery(query, config='english', search_type='websearch')
+
+    # Annotate the posts queryset with a relevance score (rank) calculated by comparing
+    # the weighted search vector to the search query; annotating the vector itself as
+    # well would make PostgreSQL build each row's tsvector a second time for a column
+    # nothing reads
     # Then filter posts with a relevance rank of at least 0.3, and order by descending relevance (highest rank first)
     return (
         Post.published.annotate(
-            search=search_vector,
             rank=SearchRank(search_vector, search_query)
         )
         .filter(rank__gte=0.3)
@@ -279,15 +415,40 @@ def trigram_search(query):
         .order_by('-similarity')
     )
 
+def hybrid_search(query):
+    """
+    Combined full-text and fuzzy search: posts matching the stored search vector are
+    unioned with posts whose title is trigram-similar to the query, so token matches
+    and typos/partial words are both answered. Each side of the OR maps onto its own
+    GIN index (search vector and title trigrams), avoiding a sequential fallback.
+
+    Args:
+        query (str): The user's search query.
+
+    Returns:
+        QuerySet: Posts matching the search query, ordered by rank, then title similarity.
+    """
+    search_query = SearchQuery(query, config='english', search_type='websearch')
+
+    return (
+        Post.published.annotate(
+            rank=SearchRank('search_vector', search_query),
+            similarity=TrigramSimilarity('title', query)
+        )
+        .filter(Q(search_vector=search_query) | Q(title__trigram_similar=query))
+        .order_by('-rank', '-similarity')
+    )
+
 # Mapping of search types to their corresponding search function
 SEARCH_FUNCTIONS = {
     'basic': basic_search,
     'ranked': ranked_search,
     'weighted': weighted_search,
     'trigram': trigram_search,
+    'hybrid': hybrid_search,
 }
 
-def post_search(request, search_type='trigram'):
+def post_search(request, search_type='hybrid'):
     """
     Search published posts based on a user-provided string using PostgreSQL full-text search.
     Delegates the search logic to different implementations depending on the search_type:
@@ -295,6 +456,7 @@ def post_search(request, search_type='trigram'):
         - ranked: Match with relevance-based ordering.
         - weighted: Ranked match with weighted fields and a relevance threshold.
         - trigram: Search using trigram similarity for fuzzy matching on the title.
+        - hybrid: Full-text match unioned with a trigram-similarity fallback on the title.
     The results are paginated.
 
     Args:
@@ -304,7 +466,7 @@ def post_search(request, search_type='trigram'):
     Returns:
         HttpResponse: Rendered HTML page with the paginated list of matched posts.
     """
-    search_form = SearchForm()
+    search_form = _EMPTY_SEARCH_FORM
     query = None
     results = Post.published.none()
 
@@ -334,7 +496,15 @@ class PostListView(ListView):
     """
     Class-based view to display a paginated list of published posts.
     """
-    queryset = Post.published.all()
+    queryset = (
+        Post.published.select_related('author')
+        .prefetch_related(
+            Prefetch('tags', queryset=Tag.objects.only('id', 'name', 'slug'))
+        )
+        .only(
+            'id', 'title', 'slug', 'body_html', 'publication_date', 'author__username'
+        )
+    )
     context_object_name = 'posts'
     paginate_by = 5
     template_name = 'blog/post/list.html'
\ No newline at end of file
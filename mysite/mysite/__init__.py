@@ -0,0 +1,4 @@
+# Import the celery app when Django starts so shared_task binds tasks to it
+from .celery import app as celery_app
+
+__all__ = ['celery_app']
@@ -0,0 +1,11 @@
+import os
+from celery import Celery
+
+# Set the default Django settings module for the celery command-line program
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mysite.settings')
+
+app = Celery('mysite')
+# Read celery configuration from Django settings, using keys prefixed with CELERY_
+app.config_from_object('django.conf:settings', namespace='CELERY')
+# Auto-discover tasks defined in a tasks.py module of each installed app
+app.autodiscover_tasks()
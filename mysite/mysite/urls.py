@@ -1,7 +1,8 @@
 from django.contrib import admin
 from django.contrib.sitemaps.views import sitemap
+from django.http import HttpResponsePermanentRedirect
 from django.urls import include, path
-from django.views.generic.base import RedirectView
+from django.views.decorators.cache import cache_page
 from blog.sitemaps import PostSitemap
 
 # Define the sitemap dictionary
@@ -10,10 +11,16 @@ sitemaps = {
     'posts': PostSitemap,
 }
 
+# Plain function instead of RedirectView: skips the class-based view's setup/dispatch
+# machinery for a response that is always the same redirect
+# A fresh response object is built per request because middleware mutates headers
+def redirect_to_blog(request):
+    return HttpResponsePermanentRedirect('/blog/')
+
 # Main URL configuration for the entire Django project
 urlpatterns = [
     # Redirect the root URL '/' to the blog homepage at '/blog/'
-    path('', RedirectView.as_view(url='/blog/', permanent=True)),
+    path('', redirect_to_blog),
 
     # URL route for the Django admin interface
     path('admin/', admin.site.urls),
@@ -22,5 +29,7 @@ urlpatterns = [
     path('blog/', include('blog.urls', namespace='blog')),
 
     # Serve the sitemap at '/sitemap.xml' using Django's built-in sitemap view
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap')
+    # Crawlers refetch it often; cache the generated XML for an hour so repeat fetches
+    # skip the post query and the serialization
+    path('sitemap.xml', cache_page(60 * 60)(sitemap), {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap')
 ]